@@ -1,8 +1,20 @@
 import sys
 import re
+import gc
+import io
+import itertools
+import os
+import mmap
+import pickle
+import hashlib
+import functools
+import contextlib
+import collections
 
 # Node class represents nodes in the AST
 class Node:
+    __slots__ = ('value', 'children')
+
     def __init__(self, value, children=None):
         self.value = value
         self.children = children if children else []
@@ -11,39 +23,56 @@ class Node:
         return f'Node({self.value}, {self.children})'
 
     def pretty_print(self, indent=0, is_last=True, prefix=""):
-        """Recursively prints the AST with ASCII visual formatting."""
-        # Determine the connector based on whether this node is the last child
-        connector = "└── " if is_last else "├── "
-        # Print current node with appropriate prefix and connector
-        print(f"{prefix}{connector}{self.value}")
-        # Update prefix for children: add "|   " if this node is not the last, else "    "
-        new_prefix = prefix + ("    " if is_last else "│   ")
-        # Print children recursively
-        child_count = len(self.children)
-        for i, child in enumerate(self.children):
-            is_last_child = (i == child_count - 1)
-            if isinstance(child, Node):
-                child.pretty_print(indent + 1, is_last_child, new_prefix)
-            else:
-                print(f"{new_prefix}{'└── ' if is_last_child else '├── '}{child}")
+        """Prints the AST with ASCII visual formatting in a single write."""
+        # indent is unused (depth is carried by prefix) but kept so positional calls still work
+        out = io.StringIO()
+        # Walk with an explicit stack so deep trees don't hit the recursion limit
+        stack = [(self, prefix, is_last)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            # Determine the connector based on whether this node is the last child
+            connector = "└── " if is_last else "├── "
+            if not isinstance(node, Node):
+                out.write(f"{prefix}{connector}{node}\n")
+                continue
+            out.write(f"{prefix}{connector}{node.value}\n")
+            # Update prefix for children: add "|   " if this node is not the last, else "    "
+            new_prefix = prefix + ("    " if is_last else "│   ")
+            # Push children in reverse so they are popped in order
+            children = node.children
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], new_prefix, i == last))
+        sys.stdout.write(out.getvalue())
 
 class DeclarationNode(Node):
+    __slots__ = ()
+
     def __init__(self, identifier, expression):
         super().__init__('Declaration', [identifier, expression])
 
 class AssignmentNode(Node):
+    __slots__ = ()
+
     def __init__(self, identifier, expression):
         super().__init__('Assignment', [identifier, expression])
 
 class BinaryOperationNode(Node):
+    __slots__ = ()
+
     def __init__(self, operator, left, right):
         super().__init__(operator, [left, right])
 
 class ValueNode(Node):
+    __slots__ = ()
+
     def __init__(self, value):
-        super().__init__(value)
+        # Names and literals repeat throughout a program, share one string per spelling
+        super().__init__(sys.intern(value))
 
 class FunctionNode(Node):
+    __slots__ = ('name', 'parameters', 'body')
+
     def __init__(self, name, parameters, body):
         super().__init__('Function', [name] + parameters + [body])
         self.name = name
@@ -96,74 +125,175 @@ class SymbolTable:
         
         return ""
 
+# Reserved words. KEYWORD tokens carry these interned strings as their values, and the
+# parser looks them up in its statement dispatch table. თუ, თუარა and დაბეჭდე are
+# reserved but not parsed yet.
+KW_IF = sys.intern('თუ')
+KW_ELSE = sys.intern('თუარა')
+KW_DECLARE = sys.intern('აი')
+KW_PRINT = sys.intern('დაბეჭდე')
+KW_FUNCTION = sys.intern('ფუნქცია')
+
 class Tokenizer:
+    KEYWORDS = frozenset((KW_IF, KW_ELSE, KW_DECLARE, KW_PRINT, KW_FUNCTION))
+    # Token tuples for operators and punctuation, built once and shared by every occurrence
+    PUNCTUATION_TOKENS = {value: (kind, sys.intern(value)) for value, kind in [
+        ('==', 'COMPARISON'), ('!=', 'COMPARISON'), ('<=', 'COMPARISON'),  # Comparison operators
+        ('>=', 'COMPARISON'), ('<', 'COMPARISON'), ('>', 'COMPARISON'),
+        ('=', 'ASSIGNMENT'),                                             # Assignment operator
+        ('+', 'OPERATOR'), ('-', 'OPERATOR'), ('*', 'OPERATOR'), ('/', 'OPERATOR'),  # Arithmetic operators
+        ('(', 'BRACKET'), (')', 'BRACKET'), ('{', 'BRACKET'), ('}', 'BRACKET'),      # Brackets
+        (';', 'SEMICOLON'),                                              # Semicolon
+        (',', 'COMMA'),                                                  # Comma for function parameters
+    ]}
     TOKEN_PATTERNS = [
-        ('COMMENT',     r'//.*'),                      # Single-line comment
-        ('NUMBER',      r'\d+'),                       # Integer
-        ('KEYWORD',     r'\b(თუ|თუარა|აი|დაბეჭდე|ფუნქცია)\b'), # Reserved words
-        ('IDENTIFIER',  r'[_\u10A0-\u10FF][_\u10A0-\u10FF0-9]*'),  # Identifiers
-        ('COMPARISON',  r'==|!=|<=|>=|<|>'),          # Comparison operators
-        ('ASSIGNMENT',  r'='),                        # Assignment operator
-        ('OPERATOR',    r'[+\-*/]'),                  # Arithmetic operators
-        ('BRACKET',     r'[(){}]'),                   # Brackets
-        ('SEMICOLON',   r';'),                        # Semicolon
-        ('COMMA',       r','),                        # Comma for function parameters
-        ('WHITESPACE',  r'\s+'),                      # Whitespace
+        r'//[^\r\n]*',                             # Single-line comment
+        r'\d+',                                    # Integer
+        r'[_\u10A0-\u10FF][_\u10A0-\u10FF0-9]*',     # Identifiers and reserved words
+        r'[=!<>]=',                                # Two-character comparison operators
+        r'[<>=+\-*/(){};,]',                       # Single-character operators and punctuation
+        r'\S',                                     # Anything else is an error, see unexpected()
     ]
+    # No capturing groups, so findall() returns the matched text of each token directly.
+    # Whitespace never matches and is skipped inside the regex engine.
+    TOKEN_REGEX = re.compile('|'.join(TOKEN_PATTERNS))
+    WINDOW_SIZE = 16384  # Characters of source matched per findall() call in stream()
 
     def __init__(self, code):
         self.code = code
-        self.token_regex = '|'.join(f'(?P<{pair[0]}>{pair[1]})' for pair in self.TOKEN_PATTERNS)
+
+    def stream(self):
+        """Yield tokens one at a time as the source is scanned, classifying each by its text."""
+        code = self.code
+        length = len(code)
+        findall = self.TOKEN_REGEX.findall
+        keywords = self.KEYWORDS
+        # Text -> token tuple. Every occurrence of the same name, number or operator shares
+        # one tuple, so the token list holds references instead of a new object per token.
+        known_tokens = dict(self.PUNCTUATION_TOKENS)
+        start = 0
+        while start < length:
+            # Scan a window at a time so only one window's matches exist at once. Windows end
+            # on a line break, which no token spans.
+            end = code.find('\n', start + self.WINDOW_SIZE)
+            if end == -1:
+                end = length
+            for value in findall(code, start, end):
+                token = known_tokens.get(value)
+                if token is None:
+                    if value[0].isdecimal():
+                        token = ('NUMBER', value)
+                    elif value[0] == '/':
+                        continue  # Comment
+                    elif value in keywords:
+                        token = ('KEYWORD', sys.intern(value))
+                    elif value[0] == '_' or '\u10A0' <= value[0] <= '\u10FF':
+                        token = ('IDENTIFIER', value)
+                    else:
+                        self.unexpected(value, start, end)
+                    known_tokens[value] = token
+                yield token
+            start = end
+
+    def unexpected(self, value, start, end):
+        """Raise a SyntaxError for a character that starts no token, first seen in code[start:end]."""
+        # Only runs on the error path, so finding the position again is cheap enough
+        for match in self.TOKEN_REGEX.finditer(self.code, start, end):
+            if match.group() == value:
+                line = self.code.count('\n', 0, match.start()) + 1
+                raise SyntaxError(f"Syntax error at line {line}: unexpected character {value!r}")
 
     def tokenize(self):
-        tokens = []
-        for match in re.finditer(self.token_regex, self.code):
-            kind = match.lastgroup
-            value = match.group(kind)
-            if kind not in ('WHITESPACE', 'COMMENT'):
-                tokens.append((kind, value))
-        return tokens
+        return list(self.stream())
+
+def memoized(rule):
+    """Packrat-memoize a Parser rule by its start position. Opt-in per rule, for rules that get re-entered."""
+    @functools.wraps(rule)
+    def parse_memoized(self):
+        memo = self.memo[rule]
+        start = self.position
+        if start in memo:
+            node, self.position = memo[start]
+            return node
+        node = rule(self)
+        memo[start] = (node, self.position)
+        return node
+    return parse_memoized
 
 # Parser for syntactic analysis
 class Parser:
+    FILL_BATCH = 256  # Tokens pulled from the stream at a time
+    PRECEDENCE = {'+': 10, '-': 10, '*': 20, '/': 20}  # Binding power of binary operators
+
     def __init__(self, tokens, symbol_table, debug=False):
-        self.tokens = tokens
+        # Tokens are pulled from the iterable only as parsing reaches them (e.g. straight
+        # from Tokenizer.stream()), so the whole token list never has to exist up front.
+        # Pulled tokens stay in self.tokens so positions keep indexing them until release()
+        # drops the ones behind a finished top-level statement.
+        self.token_stream = iter(tokens)
+        self.tokens = []
         self.position = 0
+        self.released = 0  # Tokens dropped from the front of self.tokens so far
         self.symbol_table = symbol_table
         self.debug = debug
+        self.memo = collections.defaultdict(dict)  # rule -> {start position: (node, end position)}
+        # Statements introduced by a keyword, looked up by the keyword
+        self.statement_parsers = {
+            KW_DECLARE: self.parse_declaration,
+            KW_FUNCTION: self.parse_function,
+        }
+
+    def fill(self):
+        """Pull the next batch of tokens into the buffer; returns the current token or None at the end."""
+        self.tokens.extend(itertools.islice(self.token_stream, self.FILL_BATCH))
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def release(self):
+        """Drop consumed tokens and memo entries once enough have built up.
+
+        Only called between top-level statements: parsing never goes back past one, so
+        nothing behind the current position can be read or memo-hit again.
+        """
+        if self.position >= self.FILL_BATCH:
+            del self.tokens[:self.position]
+            self.released += self.position
+            self.position = 0
+            self.memo.clear()
 
     def current_token(self):
-        return self.tokens[self.position] if self.position < len(self.tokens) else None
+        try:
+            return self.tokens[self.position]
+        except IndexError:
+            return self.fill()
 
     def consume(self, expected_type=None, expected_value=None):
         token = self.current_token()
         if not token or (expected_type and token[0] != expected_type) or (expected_value and token[1] != expected_value):
             self.error(f"Expected {expected_type} with value {expected_value} but got {token}")
         if self.debug:
-            print(f"Consuming {token} at position {self.position}")
+            print(f"Consuming {token} at position {self.released + self.position}")
         self.position += 1
         return token
 
     def error(self, message):
-        raise SyntaxError(f"Syntax error at position {self.position}: {message}")
+        raise SyntaxError(f"Syntax error at position {self.released + self.position}: {message}")
 
     def parse_statement(self):
         token = self.current_token()
         if token is None:
             return None
 
-        # Variable declaration
-        if token[0] == 'KEYWORD' and token[1] == 'აი':
-            return self.parse_declaration()
-        elif token[0] == 'IDENTIFIER':
+        if token[0] == 'IDENTIFIER':
             return self.parse_assignment()
-        elif token[0] == 'KEYWORD' and token[1] == 'ფუნქცია':
-            return self.parse_function()
+        if token[0] == 'KEYWORD':
+            statement_parser = self.statement_parsers.get(token[1])
+            if statement_parser:
+                return statement_parser()
         self.consume()
         return Node('Unknown', [])
 
     def parse_declaration(self):
-        self.consume('KEYWORD', 'აი')
+        self.consume('KEYWORD', KW_DECLARE)
         identifier = self.consume('IDENTIFIER')
         self.consume('ASSIGNMENT', '=')
         expr = self.parse_expression()
@@ -180,7 +310,7 @@ class Parser:
         return AssignmentNode(identifier, expr)
 
     def parse_function(self):
-        self.consume('KEYWORD', 'ფუნქცია')
+        self.consume('KEYWORD', KW_FUNCTION)
         function_name = self.consume('IDENTIFIER')
         self.consume('BRACKET', '(')
         parameters = self.parse_parameters()
@@ -208,10 +338,23 @@ class Parser:
                 block_node.children.append(statement)
         return block_node
 
+    # parse_factor and parse_binary run once or more for every operand,
+    # so they read the token list through locals and advance the position directly
+    # instead of going through current_token()/consume(). Like current_token(), they
+    # index the buffer without a length check and only refill it on IndexError.
     def parse_factor(self):
-        token = self.current_token()
+        tokens = self.tokens
+        pos = self.position
+        try:
+            token = tokens[pos]
+        except IndexError:
+            token = self.fill()
+        if token is None:
+            self.error("Expected factor")
         if token[0] in ('NUMBER', 'IDENTIFIER'):
-            self.consume()
+            if self.debug:
+                print(f"Consuming {token} at position {self.released + pos}")
+            self.position = pos + 1
             return ValueNode(token[1])
         elif token[0] == "BRACKET" and token[1] == "(":
             self.consume("BRACKET", "(")
@@ -220,42 +363,62 @@ class Parser:
             return node
         self.error("Expected factor")
 
-    def parse_term(self):
+    # Expressions are the rule a backtracking caller (e.g. a condition trying
+    # alternatives) would retry from the same position, so only this rule is memoized
+    @memoized
+    def parse_expression(self):
+        return self.parse_binary(0)
+
+    def parse_binary(self, min_precedence):
+        """Parse operands joined by operators binding at least as tightly as min_precedence."""
+        tokens = self.tokens
+        precedence = self.PRECEDENCE
         node = self.parse_factor()
+        pos = self.position
         while True:
-            token = self.current_token()
-            if token and token[0] == "OPERATOR" and token[1] in ("*", "/"):
-                op = self.consume("OPERATOR")
-                right = self.parse_factor()
-                node = BinaryOperationNode(op[1], node, right)
-            else:
+            try:
+                token = tokens[pos]
+            except IndexError:
+                token = self.fill()
+            if token is None or token[0] != "OPERATOR":
                 break
-        return node
-
-    def parse_expression(self):
-        node = self.parse_term()
-        while True:
-            token = self.current_token()
-            if token and token[0] == "OPERATOR" and token[1] in ("+", "-"):
-                op = self.consume("OPERATOR")
-                right = self.parse_term()
-                node = BinaryOperationNode(op[1], node, right)
-            else:
+            operator = token[1]
+            operator_precedence = precedence[operator]
+            if operator_precedence < min_precedence:
                 break
+            if self.debug:
+                print(f"Consuming {token} at position {self.released + pos}")
+            self.position = pos + 1
+            # Operators are left-associative: the right operand only takes tighter operators
+            right = self.parse_binary(operator_precedence + 1)
+            node = BinaryOperationNode(operator, node, right)
+            pos = self.position
         return node
 
     def parse(self):
         root = Node("Program")
-        while self.position < len(self.tokens):
+        while self.current_token() is not None:
             stmnt = self.parse_statement()
             if stmnt:
                 root.children.append(stmnt)
+            self.release()
         return root
 
 class IntermediateCodeGenerator:
     def __init__(self):
-        self.instructions = []  # List to store TAC instructions
+        self.instructions = []  # TAC instructions as tuples, formatted only by dump()
         self.temp_counter = 0   # Counter to generate temporary variables
+        self.cse = {}           # (left, operator, right) -> temporary already holding that value
+        self.cse_uses = {}      # Operand -> cse keys that read it
+        # Generator for each AST node class, resolved once instead of per visited node
+        self.generators = {
+            DeclarationNode: self.gen_DeclarationNode,
+            AssignmentNode: self.gen_AssignmentNode,
+            BinaryOperationNode: self.gen_BinaryOperationNode,
+            ValueNode: self.gen_ValueNode,
+            FunctionNode: self.gen_FunctionNode,
+            Node: self.gen_Node,
+        }
 
     def new_temp(self):
         """Generate a new temporary variable."""
@@ -265,9 +428,12 @@ class IntermediateCodeGenerator:
 
     def generate(self, node):
         """Generate TAC for a given AST node."""
-        method_name = f"gen_{type(node).__name__}"
-        generator = getattr(self, method_name, self.generic_gen)
-        return generator(node)
+        return self.generators.get(type(node), self.generic_gen)(node)
+
+    def invalidate(self, name):
+        """Forget cached subexpressions that read a variable which has just been overwritten."""
+        for key in self.cse_uses.pop(name, ()):
+            self.cse.pop(key, None)
 
     def generic_gen(self, node):
         raise NotImplementedError(f"No generator for node type: {type(node).__name__}")
@@ -275,20 +441,29 @@ class IntermediateCodeGenerator:
     def gen_DeclarationNode(self, node):
         identifier = node.children[0][1]  # Identifier name
         expression = self.generate(node.children[1])  # Evaluate expression
-        self.instructions.append(f"{identifier} = {expression}")
+        self.instructions.append(('ASN', identifier, expression))
+        self.invalidate(identifier)
         return identifier
 
     def gen_AssignmentNode(self, node):
         identifier = node.children[0][1]  # Identifier name
         expression = self.generate(node.children[1])  # Evaluate expression
-        self.instructions.append(f"{identifier} = {expression}")
+        self.instructions.append(('ASN', identifier, expression))
+        self.invalidate(identifier)
         return identifier
 
     def gen_BinaryOperationNode(self, node):
         left = self.generate(node.children[0])  # Generate TAC for left operand
         right = self.generate(node.children[1])  # Generate TAC for right operand
+        key = (left, node.value, right)
+        temp = self.cse.get(key)
+        if temp is not None:
+            return temp  # Same operation on the same operands was already computed
         temp = self.new_temp()  # Create a new temporary variable
-        self.instructions.append(f"{temp} = {left} {node.value} {right}")
+        self.instructions.append(('BIN', temp, left, node.value, right))
+        self.cse[key] = temp
+        self.cse_uses.setdefault(left, set()).add(key)
+        self.cse_uses.setdefault(right, set()).add(key)
         return temp
 
     def gen_ValueNode(self, node):
@@ -297,19 +472,153 @@ class IntermediateCodeGenerator:
     def gen_FunctionNode(self, node):
         function_name = node.name[1]
         parameters = [param[1] for param in node.parameters]
-        self.instructions.append(f"func {function_name}({', '.join(parameters)}) {{")
+        # Temporaries are not shared between a function body and the surrounding code
+        self.cse.clear()
+        self.cse_uses.clear()
+        self.instructions.append(('FUNC', function_name, parameters))
         self.generate(node.body)
-        self.instructions.append("}")
+        self.instructions.append(('END',))
+        self.cse.clear()
+        self.cse_uses.clear()
         return function_name
 
     def gen_Node(self, node):
         for child in node.children:
             self.generate(child)
 
+    def dump(self, out=None):
+        """Write the instructions as text, one per line, in a single write."""
+        buf = io.StringIO()
+        for instruction in self.instructions:
+            kind = instruction[0]
+            if kind == 'BIN':
+                buf.write(f"{instruction[1]} = {instruction[2]} {instruction[3]} {instruction[4]}\n")
+            elif kind == 'ASN':
+                buf.write(f"{instruction[1]} = {instruction[2]}\n")
+            elif kind == 'FUNC':
+                buf.write(f"func {instruction[1]}({', '.join(instruction[2])}) {{\n")
+            elif kind == 'END':
+                buf.write("}\n")
+        (out or sys.stdout).write(buf.getvalue())
+
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aiia")
+CACHE_ENABLED = os.environ.get("AIIA_NO_CACHE") != "1"  # Set AIIA_NO_CACHE=1 to never touch CACHE_DIR
+CACHE_MAX_ENTRIES = 64  # Least recently used entries beyond this are deleted
+
+def compiler_digest():
+    """Digest of this module's name and source, used to salt cache keys."""
+    # Cached results are only valid for the exact compiler that produced them. Pickles
+    # record classes under the module name (__main__ when run as a script), so script
+    # runs and importers keep separate entries instead of overwriting each other's.
+    digest = hashlib.blake2b(__name__.encode("utf-8") + b"\0", digest_size=16)
+    with open(__file__, "rb") as file:
+        digest.update(file.read())
+    return digest.digest()
+
+COMPILER_DIGEST = compiler_digest()
+
+@contextlib.contextmanager
+def map_file(filename):
+    """Yield a read-only view of a file's bytes through a memory map, without copying them."""
+    with open(filename, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""  # mmap refuses empty files
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+def decode_source(data):
+    """Decode UTF-8 source bytes, dropping a leading byte order mark."""
+    return str(data, "utf-8-sig")
 
 def read_file(filename):
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read()
+    """Read a UTF-8 source file, decoding straight from a memory map without an extra bytes copy."""
+    with map_file(filename) as data:
+        return decode_source(data)
+
+def compile_source(content):
+    """Tokenize, parse and generate TAC for source text. Returns (ast, symbol_table, icg)."""
+    # Apart from the parser's and code generator's own tables of bound methods, nothing
+    # built here forms a reference cycle, so the cyclic garbage collector has almost
+    # nothing to reclaim while the AST is built. Pause it for the whole front end instead
+    # of letting every burst of node allocations trigger a collection pass.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # The parser pulls tokens from the tokenizer as it goes
+        tokenizer = Tokenizer(content)
+        symbol_table = SymbolTable()
+        parser = Parser(tokenizer.stream(), symbol_table, debug=False)
+        ast = parser.parse()
+
+        # Generate intermediate code
+        icg = IntermediateCodeGenerator()
+        icg.generate(ast)
+    finally:
+        if gc_was_enabled:
+            gc.enable()  # Leave the collector off if the caller had turned it off
+    return ast, symbol_table, icg
+
+def load_cached(path):
+    """Return the result pickled at path, or None if there is no usable entry."""
+    try:
+        with open(path, "rb") as file:
+            result = pickle.load(file)
+    except Exception:
+        return None  # A missing, truncated or unloadable entry just means compiling again
+    try:
+        os.utime(path)  # Mark the entry as recently used for prune_cache()
+    except OSError:
+        pass
+    return result
+
+def store_cached(path, result):
+    """Pickle a result to path and trim the cache directory back to CACHE_MAX_ENTRIES."""
+    try:
+        data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(data)
+    except (OSError, RecursionError):
+        return  # Caching is best effort, e.g. a read-only home directory or a very deep AST
+    prune_cache()
+
+def prune_cache():
+    """Delete the least recently used cache entries beyond CACHE_MAX_ENTRIES."""
+    try:
+        entries = [entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith(".pkl")]
+        if len(entries) <= CACHE_MAX_ENTRIES:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    except OSError:
+        return
+    for entry in entries[:-CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass  # Already removed by a concurrent run
+
+@functools.lru_cache(maxsize=128)
+def compile_file(filename, mtime, size):
+    """Compile a file, reusing the pickled result of any earlier run on identical source."""
+    cache_path = None
+    with map_file(filename) as data:
+        if CACHE_ENABLED:
+            # Keyed by content rather than path or mtime, so touching, copying or checking
+            # out the same source again still hits the cache
+            digest = hashlib.blake2b(data, digest_size=16, salt=COMPILER_DIGEST)
+            cache_path = os.path.join(CACHE_DIR, digest.hexdigest() + ".pkl")
+            result = load_cached(cache_path)
+            if result is not None:
+                return result
+        # Decode from the same map that was hashed, so the entry matches what was compiled
+        content = decode_source(data)
+
+    result = compile_source(content)
+    if cache_path is not None:
+        store_cached(cache_path, result)
+    return result
 
 # Main function to orchestrate reading, tokenizing, parsing, and output.
 def main():
@@ -318,24 +627,15 @@ def main():
         return
 
     input_filename = sys.argv[1]
-    content = read_file(input_filename)
-    tokenizer = Tokenizer(content)
-    tokens = tokenizer.tokenize()
+    stat = os.stat(input_filename)
+    ast, symbol_table, icg = compile_file(input_filename, stat.st_mtime_ns, stat.st_size)
 
-    symbol_table = SymbolTable()
-    parser = Parser(tokens, symbol_table, debug=False)
-    ast = parser.parse()
     ast.pretty_print()
     print("\nSymbol Table:")
     print(symbol_table)
 
-    # Generate intermediate code
-    icg = IntermediateCodeGenerator()
-    icg.generate(ast)
-
     print("\nThree-Address Code:")
-    for instruction in icg.instructions:
-        print(instruction)
+    icg.dump()
 
 if __name__ == "__main__":
     main()